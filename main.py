@@ -1,15 +1,47 @@
 from time import sleep
-import pdfplumber
+from pdfminer.high_level import extract_text as pdfminer_extract_text
+from pdfminer.layout import LAParams
+from pdfminer.pdfpage import PDFPage
+import numpy as np
 import pandas as pd
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator
+from collections import deque
+from operator import itemgetter
 import yaml
 import os
 import inquirer
 from datetime import datetime
 import sys
+import hashlib
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 import readchar
 
+# Default upper bound on pages parsed per batch, keeps memory bounded on huge PDFs;
+# can be changed with page_batch_size in settings.yaml
+PAGE_BATCH_SIZE = 500
+# Fewest pages worth starting a worker process for, start-up (imports) takes about
+# as long as parsing this many pages
+MIN_PAGES_PER_WORKER = 20
+# Columns of the records produced by DataProcessor.process_data, one row per priced line
+# plus one row without a period per section, so titles without prices keep their sheet
+RECORD_COLUMNS = ("title", "period", "file_idx", "price")
+# Improved date pattern to better capture German date formats, compiled once per process
+DATE_PATTERN = re.compile(r"(?P<start_month>Jan|Feb|Mrz|Apr|Mai|Jun|Jul|Aug|Sep|Okt|Nov|Dez)\s*(?P<start_year>\d{2})(?:\s*-\s*(?P<end_month>Jan|Feb|Mrz|Apr|Mai|Jun|Jul|Aug|Sep|Okt|Nov|Dez)\s*(?P<end_year>\d{2}))?")
+# Dates and prices of a data line, matched in a single scan; dates are a lookahead
+# so their digits are still scanned for prices, as separate searches would
+LINE_PATTERN = re.compile(rf"(?=(?P<date>{DATE_PATTERN.pattern}))|(?P<price>\d{{3}}(?:,\d{{1,2}})?)")
+MONTH_ORDER = {
+    'Jan': 1, 'Feb': 2, 'Mrz': 3, 'Apr': 4, 'Mai': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Okt': 10, 'Nov': 11, 'Dez': 12
+}
+# Bump when extraction output changes so stale cached text is not reused
+TEXT_CACHE_VERSION = 2
+# Large char_margin keeps each table row on one line, like pdfplumber did
+LAYOUT_PARAMS = LAParams(char_margin=100.0)
+
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller"""
     try:
@@ -20,143 +52,269 @@ def get_resource_path(relative_path):
     
     return os.path.join(base_path, relative_path)
 
+def get_cache_dir():
+    """Directory for cached PDF text, kept between runs"""
+    if getattr(sys, 'frozen', False):
+        # The onefile build unpacks into a temp folder (_MEIPASS) that is removed
+        # on exit, so keep the cache next to the executable instead
+        return os.path.join(os.path.dirname(sys.executable), ".pdf-cache")
+    return get_resource_path(".pdf-cache")
+
+def _extract_range(pdf_path: str, start: int, end: int) -> str:
+    """Extract text of pages start..end (1-based, inclusive) in a worker process"""
+    return pdfminer_extract_text(pdf_path, page_numbers=range(start - 1, end), laparams=LAYOUT_PARAMS)
+
+def _count_pages(pdf_path: str) -> int:
+    """Count pages by walking the page tree, without parsing page contents"""
+    with open(pdf_path, 'rb') as f:
+        return sum(1 for _ in PDFPage.get_pages(f))
+
 class PDFExtractor:
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, max_workers: Optional[int] = None):
         self.pdf_path = pdf_path
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache_dir = get_cache_dir()
+        # Entries are named <path key>.<state key>.txt: the state key changes whenever
+        # the file is replaced or modified, the path key finds its stale entries
+        stat = os.stat(pdf_path)
+        self.path_key = hashlib.blake2b(pdf_path.encode(), digest_size=16).hexdigest()
+        state_key = hashlib.blake2b(f"{TEXT_CACHE_VERSION}:{stat.st_mtime}:{stat.st_size}".encode(), digest_size=16).hexdigest()
+        self.cache_path = os.path.join(self.cache_dir, f"{self.path_key}.{state_key}.txt")
         
-    def extract_text(self) -> str:
-        text_data = []
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for page in pdf.pages:
-                text_data.append(page.extract_text())
-        return "\n".join(text_data)
+    def extract_pages(self, batch: int = PAGE_BATCH_SIZE) -> Iterator[str]:
+        """Yield the PDF text in page order, at most `batch` pages at a time"""
+        # Reuse text extracted on a previous run, streamed line by line
+        try:
+            cached = open(self.cache_path, 'r', encoding='utf-8', newline='\n')
+        except OSError:
+            pass
+        else:
+            with cached:
+                yield from cached
+            return
+
+        page_count = _count_pages(self.pdf_path)
+
+        # Split pages into contiguous slices, one or more per worker; small PDFs
+        # don't pay for starting worker processes
+        workers = max(1, min(self.max_workers, page_count // MIN_PAGES_PER_WORKER))
+        slice_size = max(1, min(batch, -(-page_count // workers)))
+        slices = [
+            (start, min(start + slice_size - 1, page_count))
+            for start in range(1, page_count + 1, slice_size)
+        ]
+
+        # Written next to the final file and moved into place only once complete
+        partial_path = f"{self.cache_path}.part"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._remove_stale_entries()
+            cache_file = open(partial_path, 'w', encoding='utf-8', newline='')
+        except OSError as e:
+            # E.g. a read-only install directory, extract without caching
+            print(f"Warning: text cache unavailable ({e})")
+            yield from self._extract_slices(slices, workers)
+            return
+
+        caching, completed = True, False
+        try:
+            for text in self._extract_slices(slices, workers):
+                if caching:
+                    try:
+                        cache_file.write(text + "\n")
+                    except OSError as e:
+                        print(f"Warning: text cache unavailable ({e})")
+                        caching = False
+                yield text
+            completed = True
+        finally:
+            try:
+                cache_file.close()
+                if caching and completed:
+                    os.replace(partial_path, self.cache_path)
+            except OSError as e:
+                print(f"Warning: text cache unavailable ({e})")
+            # Failed, abandoned or uncached extraction, don't leave a partial entry behind
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(partial_path)
+
+    def _remove_stale_entries(self):
+        """Remove cached text of earlier versions of this file, and leftover partial entries"""
+        prefix = f"{self.path_key}."
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.startswith(prefix):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def _extract_slices(self, slices, workers: int) -> Iterator[str]:
+        """Extract slices in order, keeping at most `workers` of them in flight"""
+        if workers <= 1 or len(slices) <= 1:
+            for start, end in slices:
+                yield _extract_range(self.pdf_path, start, end)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for start, end in slices:
+                pending.append(executor.submit(_extract_range, self.pdf_path, start, end))
+                if len(pending) >= workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
 
 class TextParser:
     def __init__(self, title_keywords: List[str]):
         self.title_keywords = title_keywords
-        self.title_pattern = re.compile(rf"^({'|'.join(title_keywords)})[\w\s/-]*")
-        # Improved date pattern to better capture German date formats
-        self.date_pattern = re.compile(r"(Jan|Feb|Mrz|Apr|Mai|Jun|Jul|Aug|Sep|Okt|Nov|Dez)\s*(\d{2})(?:\s*-\s*(Jan|Feb|Mrz|Apr|Mai|Jun|Jul|Aug|Sep|Okt|Nov|Dez)\s*(\d{2}))?")
+        # Title lines start with one of the keywords; tuple startswith checks all prefixes in C
+        self.title_prefixes = tuple(keyword for keyword in title_keywords if keyword)
     
-    def parse_sections(self, text: str) -> Dict[str, List[str]]:
+    def parse_sections(self, chunks: Iterable[str]) -> Dict[str, List[str]]:
+        """Build sections from text chunks as they are extracted; chunks end on line boundaries"""
         sections = {}
         current_title = None
         
-        for line in text.split("\n"):
-            line = line.strip()
-            if self.title_pattern.match(line):
-                current_title = line
-                sections[current_title] = []
-            elif current_title and line and not line.startswith("Ernte"):
-                sections[current_title].append(line)
+        for chunk in chunks:
+            for line in chunk.split("\n"):
+                line = line.strip()
+                # Blank lines are frequent between table rows and never carry data
+                if not line:
+                    continue
+                if line.startswith(self.title_prefixes):
+                    current_title = line
+                    sections[current_title] = []
+                elif current_title and not line.startswith("Ernte"):
+                    sections[current_title].append(line)
         return sections
 
 class DataProcessor:
-    def __init__(self, date_pattern):
-        self.date_pattern = date_pattern
-        self.month_order = {
-            'Jan': 1, 'Feb': 2, 'Mrz': 3, 'Apr': 4, 'Mai': 5, 'Jun': 6,
-            'Jul': 7, 'Aug': 8, 'Sep': 9, 'Okt': 10, 'Nov': 11, 'Dez': 12
-        }
+    def __init__(self):
+        # Dates and prices are found in a single scan of each line
+        self.line_pattern = LINE_PATTERN
         
     def parse_date_period(self, match):
-        """Enhanced date period parser"""
+        """Enhanced date period parser, takes a date match of line_pattern"""
         if not match:
             return None
             
-        groups = match[0]
-        if len(groups) >= 2:  # At least one date
-            start_month, start_year = groups[0], groups[1]
-            
-            if len(groups) >= 4 and groups[2] and groups[3]:  # Date range
-                end_month, end_year = groups[2], groups[3]
-                return f"{start_month} {start_year} - {end_month} {end_year}"
-            else:  # Single date
-                return f"{start_month} {start_year}"
-        return None
-
-    def sort_periods(self, periods):
+        start_month, start_year, end_month, end_year = match.group(
+            "start_month", "start_year", "end_month", "end_year"
+        )
+        if end_month and end_year:  # Date range
+            return f"{start_month} {start_year} - {end_month} {end_year}"
+        else:  # Single date
+            return f"{start_month} {start_year}"
+
+    @staticmethod
+    def period_key(period):
+        """Chronological sort key of a period, taken from its start date"""
+        month, year = period.split(' - ')[0].split()
+        return int(year), MONTH_ORDER[month]
+
+    @staticmethod
+    def sort_periods(periods):
         """Sort periods chronologically"""
-        def period_key(period):
-            if ' - ' in period:
-                start, _ = period.split(' - ')
-                month, year = start.split()
-            else:
-                month, year = period.split()
-            return int(year), self.month_order[month]
-            
-        return sorted(periods, key=period_key)
+        # Each key is computed once up front, not re-parsed on every comparison
+        keyed = [(DataProcessor.period_key(period), period) for period in periods]
+        keyed.sort(key=itemgetter(0))
+        return [period for _, period in keyed]
         
-    def validate_price(self, price: float) -> bool:
-        """Enhanced price validation"""
+    @staticmethod
+    def validate_prices(prices: np.ndarray) -> np.ndarray:
+        """Enhanced price validation, returns a boolean mask over the prices"""
         return (
-            isinstance(price, (int, float)) and 
-            100 <= price <= 1000 and  # Basic range check
-            price % 1 <= 0.99  # Ensure reasonable decimal places
+            (prices >= 100) & (prices <= 1000) &  # Basic range check
+            (prices % 1 <= 0.99)  # Ensure reasonable decimal places
         )
         
-    def calculate_statistics(self, prices: List[float]) -> Dict:
-        """Calculate price statistics"""
-        valid_prices = [p for p in prices if self.validate_price(p)]
-        if not valid_prices:
-            return {"avg": "-", "min": "-", "max": "-", "count": 0}
-            
-        return {
-            "avg": round(sum(valid_prices) / len(valid_prices), 2),
-            "min": round(min(valid_prices), 2),
-            "max": round(max(valid_prices), 2),
-            "count": len(valid_prices)
-        }
+    def calculate_averages(self, prices: np.ndarray, line_starts: np.ndarray) -> np.ndarray:
+        """Average the valid prices of every line at once
+
+        prices holds the prices of all lines back to back and line_starts the offset of
+        each line's first price; lines without a valid price get NaN.
+        """
+        valid = self.validate_prices(prices)
+        values = np.where(valid, prices, 0.0)
+        counts = np.add.reduceat(valid.astype(np.int64), line_starts)
+
+        # Step k adds the k-th price of every line that has one, so each line's prices
+        # are added in order, exactly like sum(); reduceat reorders the additions and
+        # can move averages by a cent after rounding. Longest lines come first so the
+        # lines still being added always form a prefix
+        line_lengths = np.diff(line_starts, append=len(prices))
+        order = np.argsort(-line_lengths, kind='stable')
+        starts = line_starts[order]
+        still_adding = np.searchsorted(-line_lengths[order], -np.arange(line_lengths.max()))
+        sums = np.zeros(len(line_starts))
+        for offset, count in enumerate(still_adding.tolist()):
+            sums[:count] += values[starts[:count] + offset]
+
+        line_sums = np.empty_like(sums)
+        line_sums[order] = sums
+        # Values are left unrounded: np.round scales by 100 first and can round
+        # half-cent averages the other way than round(x, 2)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return line_sums / counts
         
-    def process_data(self, sections: Dict[str, List[str]], file_index: int) -> dict:
-        all_data = {}
+    def process_data(self, sections: Dict[str, List[str]], file_index: int) -> Dict[str, list]:
+        """Collect one record per section and per dated line with prices, as parallel column lists"""
+        records = {column: [] for column in RECORD_COLUMNS}
+        scan_line = self.line_pattern.finditer
+        # Prices of all kept lines back to back, validated and averaged once per file
+        file_prices = []
+        line_starts = []
+        # Record rows of those lines, which get the averages
+        line_rows = []
         
         for title, lines in sections.items():
-            if title not in all_data:
-                all_data[title] = {}
-                
+            records["title"].append(title)
+            records["period"].append(None)
+            records["file_idx"].append(file_index)
+
             for line in lines:
-                dates = self.date_pattern.findall(line)
-                if not dates:
+                # Premium lines never contribute prices
+                if "Prämie" in line:
                     continue
-                    
-                period = self.parse_date_period(dates)
+
+                # Walk dates and prices in one pass, the first date gives the period
+                period = None
+                prices = []
+                for match in scan_line(line):
+                    if match.lastgroup == "price":
+                        prices.append(float(match.group("price").replace(",", ".")))
+                    elif period is None:
+                        period = self.parse_date_period(match)
+
                 if not period:
                     continue
-                    
-                # Extract prices with improved regex
-                prices = [
-                    p for p in re.findall(r'\d{3}(?:,\d{1,2})?', line)
-                    if "Prämie" not in line
-                ]
                 
                 if not prices:
                     continue
-                    
-                if period not in all_data[title]:
-                    all_data[title][period] = {
-                        "prices": [],
-                        "file_averages": {},
-                        "raw_prices": []
-                    }
                 
-                try:
-                    numeric_prices = [float(p.replace(",", ".")) for p in prices]
-                    valid_prices = [p for p in numeric_prices if self.validate_price(p)]
-                    
-                    if valid_prices:
-                        all_data[title][period]["prices"].extend(valid_prices)
-                        all_data[title][period]["raw_prices"].extend(prices)
-                        stats = self.calculate_statistics(valid_prices)
-                        all_data[title][period]["file_averages"][file_index] = stats["avg"]
-                except ValueError:
-                    continue
-                    
-        return all_data
+                line_rows.append(len(records["title"]))
+                line_starts.append(len(file_prices))
+                file_prices.extend(prices)
+                records["title"].append(title)
+                records["period"].append(period)
+                records["file_idx"].append(file_index)
+
+        records["price"] = [np.nan] * len(records["title"])
+        if not line_starts:
+            return records
+
+        # Validation runs once over the whole file; lines without a valid price are
+        # kept as NaN so the period still gets a column
+        numeric_prices = np.array(file_prices, dtype=np.float64)
+        averages = self.calculate_averages(numeric_prices, np.array(line_starts, dtype=np.intp))
+        for row, avg in zip(line_rows, averages.tolist()):
+            records["price"][row] = round(avg, 2)
+        return records
 
 class ExcelExporter:
     def __init__(self, output_path: str):
         self.output_path = output_path
+        self.invalid_chars_pattern = re.compile(r'[\[\]:*?/\\]')  # Changed from r'[[\]:*?/\\]'
         
     def sanitize_sheet_name(self, name: str) -> str:
         """
@@ -166,8 +324,7 @@ class ExcelExporter:
         - Cannot be empty or consist only of spaces
         """
         # Remove or replace invalid characters
-        invalid_chars = r'[\[\]:*?/\\]'  # Changed from r'[[\]:*?/\\]'
-        name = re.sub(invalid_chars, '_', name)
+        name = self.invalid_chars_pattern.sub('_', name)
         
         # Trim spaces from start and end
         name = name.strip()
@@ -183,16 +340,33 @@ class ExcelExporter:
         return name
         
     def export_to_excel(self, combined_data: dict, num_files: int, file_names: List[str]):
-        if not combined_data:
+        if not combined_data["title"]:
             print("Warning: No data found to process")
             return
+
+        # When several lines of one file share a period the last valid price wins;
+        # groups are kept in the order they were found and section rows, which have
+        # no period, are dropped
+        # Built from column lists, so every column gets its own contiguous buffer
+        records = pd.DataFrame(combined_data)
+        latest = records.groupby(["title", "period", "file_idx"], sort=False)["price"].last().reset_index()
+        latest_by_title = dict(iter(latest.groupby("title", sort=False)))
             
-        writer = pd.ExcelWriter(self.output_path, engine='openpyxl')
+        # constant_memory flushes each row to disk once the next one is started,
+        # so every sheet has to be written strictly row by row (see write_sheet)
+        writer = pd.ExcelWriter(
+            self.output_path,
+            engine='xlsxwriter',
+            engine_kwargs={'options': {'constant_memory': True}}
+        )
+        # Formats are created once and shared by every sheet
+        self.formats = self.create_formats(writer.book)
         
-        used_names = set()
+        used_names = {"Details"}
+        details_rows = []
         
-        # First, create main sheets
-        for title, periods in combined_data.items():
+        # First, create main sheets, in the order titles were found
+        for title in records["title"].unique():
             base_name = self.sanitize_sheet_name(title)
             sheet_name = base_name
             counter = 1
@@ -203,115 +377,93 @@ class ExcelExporter:
             
             used_names.add(sheet_name)
             
-            processor = DataProcessor(None)
-            sorted_periods = processor.sort_periods(periods.keys())
-            
-            # Create new data structure for horizontal layout
-            headers = ["Data Type"] + sorted_periods
-            rows = []
-            
-            # Add rows for each file using actual file names
-            for i in range(num_files):
-                row = [file_names[i]]  # Use actual filename instead of "File N"
-                for period in sorted_periods:
-                    value = periods[period]["file_averages"].get(i, "-")
-                    row.append(value)
-                rows.append(row)
-            
-            # Create DataFrame with the new structure
-            df = pd.DataFrame(rows, columns=headers)
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
-            
-            # Apply formatting as before
-            worksheet = writer.sheets[sheet_name]
-            self.apply_formatting(worksheet)
+            # Horizontal layout: one row per file, one column per period. pivot sorts its
+            # columns, so periods are sorted from first-seen order to keep ties stable
+            title_records = latest_by_title.get(title, latest.iloc[:0])
+            table = title_records.pivot(index="file_idx", columns="period", values="price")
+            periods = title_records["period"].unique()
+            sorted_periods = DataProcessor.sort_periods(periods)
+            table = table.reindex(index=range(num_files), columns=sorted_periods)
+
+            # Collect file details with actual file names, periods in the order found
+            for period in periods:
+                for file_idx, price in table[period].dropna().items():
+                    details_rows.append([
+                        file_names[file_idx],  # Use actual filename
+                        f"{title} {period}",
+                        price
+                    ])
+
+            df = table.astype(object).where(table.notna(), "-").rename_axis(columns=None)
+            df.insert(0, "Data Type", file_names[:num_files])  # Use actual filename instead of "File N"
+            self.write_sheet(writer, df, sheet_name)
 
         # Create details sheet
-        details_sheet = writer.book.create_sheet("Details")
         details_headers = ["File Name", "Type", "Price"]
-        details_rows = []
-
-        # Collect all file details with actual file names
-        for title, periods in combined_data.items():
-            for period, data in periods.items():
-                for file_idx, price in data["file_averages"].items():
-                    if price != "-":
-                        details_rows.append([
-                            file_names[file_idx],  # Use actual filename
-                            f"{title} {period}",
-                            price
-                        ])
-
-        # Create and format details sheet
         details_df = pd.DataFrame(details_rows, columns=details_headers)
-        details_df.to_excel(writer, sheet_name="Details", index=False)
-        
-        # Format details sheet
-        details_worksheet = writer.sheets["Details"]
-        self.apply_formatting(details_worksheet)
-        
-        # Adjust column widths for details sheet
-        for column in details_worksheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-            details_worksheet.column_dimensions[column_letter].width = max_length + 4
+
+        # Column widths can't be read back from the sheet in constant_memory mode,
+        # so they are computed from the data before writing, one vectorized
+        # string-length pass per column
+        value_lengths = details_df.astype(str).apply(lambda column: column.str.len()).max()
+        column_widths = [
+            max(len(column), 0 if pd.isna(length) else int(length)) + 4
+            for column, length in value_lengths.items()
+        ]
+        self.write_sheet(writer, details_df, "Details", column_widths)
 
         writer.close()
 
-    def apply_formatting(self, worksheet):
+    def create_formats(self, workbook) -> Dict:
         """Helper method for common formatting"""
-        from openpyxl.styles import Font, Border, Side, Alignment, PatternFill
-        
-        header_font = Font(bold=True, size=12)
-        normal_font = Font(size=11)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        header_fill = PatternFill(start_color='E0E0E0', end_color='E0E0E0', fill_type='solid')
-        
+        border = {'border': 1}
+        return {
+            "header": workbook.add_format({
+                **border, 'bold': True, 'font_size': 12, 'bg_color': '#E0E0E0',
+                'align': 'center', 'valign': 'vcenter', 'text_wrap': True
+            }),
+            "data": workbook.add_format({
+                **border, 'font_size': 11, 'align': 'center', 'valign': 'vcenter'
+            })
+        }
+
+    def write_sheet(self, writer, df: pd.DataFrame, sheet_name: str, column_widths: Optional[List[int]] = None):
+        """Write a DataFrame row by row with the common formatting"""
+        worksheet = writer.book.add_worksheet(sheet_name)
+        header_format = self.formats["header"]
+        data_format = self.formats["data"]
+
+        if column_widths:
+            for col_idx, width in enumerate(column_widths):
+                worksheet.set_column(col_idx, col_idx, width)
+
         # Format headers
-        for cell in worksheet[1]:
-            cell.font = header_font
-            cell.border = border
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-        
-        # Format data cells
-        for row in worksheet.iter_rows(min_row=2):
-            for cell in row:
-                cell.font = normal_font
-                cell.border = border
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-                
-                if cell.value is None or cell.value == "":
-                    cell.value = "-"
+        worksheet.write_row(0, 0, [str(column) for column in df.columns], header_format)
+
+        # Format data cells, empty values are shown as "-"
+        df = df.astype(object).where(df.notna() & (df != ""), "-")
+        for row_idx, row in enumerate(df.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row_idx, 0, row, data_format)
         
         # Freeze first row
-        worksheet.freeze_panes = "A2"
+        worksheet.freeze_panes(1, 0)
         
         # Remove grid lines
-        worksheet.sheet_view.showGridLines = False
+        worksheet.hide_gridlines(2)
 
 class Settings:
     def __init__(self):
         self.settings_path = get_resource_path("settings.yaml")
         self.default_settings = {
-            "title_keywords": ["Weizen", "F-Weizen"]
+            "title_keywords": ["Weizen", "F-Weizen"],
+            "page_batch_size": PAGE_BATCH_SIZE
         }
 
     def load_settings(self):
-        if os.path.exists(self.settings_path):
+        try:
             with open(self.settings_path, 'r') as f:
                 return yaml.safe_load(f)
-        else:
+        except FileNotFoundError:
             with open(self.settings_path, 'w') as f:
                 yaml.dump(self.default_settings, f)
             return self.default_settings
@@ -320,6 +472,15 @@ class Settings:
         with open(self.settings_path, 'w') as f:
             yaml.dump(settings, f)
 
+    @staticmethod
+    def page_batch_size(settings) -> int:
+        """Pages extracted per batch, PAGE_BATCH_SIZE unless settings give a positive integer"""
+        try:
+            batch = int(settings.get("page_batch_size", PAGE_BATCH_SIZE))
+        except (TypeError, ValueError, OverflowError):
+            return PAGE_BATCH_SIZE
+        return batch if batch >= 1 else PAGE_BATCH_SIZE
+
 
 def clear_console():
     if os.name == 'nt':  # for Windows
@@ -396,8 +557,7 @@ class PDFFileHandler:
         self.pdf_dir = get_resource_path("pdf-files")
 
     def ensure_pdf_directory(self):
-        if not os.path.exists(self.pdf_dir):
-            os.makedirs(self.pdf_dir)
+        os.makedirs(self.pdf_dir, exist_ok=True)
 
     def get_pdf_files(self):
         pdf_files = []
@@ -427,6 +587,29 @@ class PDFFileHandler:
             
         return selected_files
 
+def _process_file(args):
+    """Extract, parse and process a single PDF in a worker process"""
+    file_index, pdf_path, title_keywords, page_workers, page_batch_size = args
+
+    pdf_extractor = PDFExtractor(pdf_path, max_workers=page_workers)
+    pdf_pages = pdf_extractor.extract_pages(page_batch_size)
+
+    text_parser = TextParser(title_keywords)
+    sections = text_parser.parse_sections(pdf_pages)
+
+    data_processor = DataProcessor()
+    file_data = data_processor.process_data(sections, file_index)
+    return file_index, file_data
+
+def _process_files(jobs, workers: int):
+    """Yield _process_file results in job order, in-process when one worker is enough"""
+    if workers <= 1:
+        yield from map(_process_file, jobs)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_process_file, jobs)
+
 def main():
     menu_handler = MenuHandler()
     pdf_handler = PDFFileHandler()
@@ -452,41 +635,34 @@ def main():
                 continue
 
             title_keywords = menu_handler.settings["title_keywords"]
+            page_batch_size = Settings.page_batch_size(menu_handler.settings)
             
             # Create excel-output directory if it doesn't exist
-            if not os.path.exists(get_resource_path("excel-output")):
-                os.makedirs(get_resource_path("excel-output"))
+            os.makedirs(get_resource_path("excel-output"), exist_ok=True)
                 
             # Get current date in a readable format
             current_time = datetime.now().strftime("%d-%B-%Y_%H-%M")
             
-            # Initialize combined data dictionary
-            combined_data = {}
+            # Initialize combined records
+            combined_data = {column: [] for column in RECORD_COLUMNS}
             file_count = len(selected_files)
             file_names = [f[1] for f in selected_files]  # Extract filenames
             
-            # Process each selected file
-            for file_index, (pdf_path, filename) in enumerate(selected_files):
-                pdf_extractor = PDFExtractor(pdf_path)
-                pdf_text = pdf_extractor.extract_text()
-                
-                text_parser = TextParser(title_keywords)
-                sections = text_parser.parse_sections(pdf_text)
+            # Process selected files in parallel, splitting cores between files and pages
+            cpu_count = os.cpu_count() or 1
+            file_workers = min(file_count, cpu_count)
+            page_workers = max(1, cpu_count // file_workers)
+            jobs = [
+                (file_index, pdf_path, title_keywords, page_workers, page_batch_size)
+                for file_index, (pdf_path, filename) in enumerate(selected_files)
+            ]
 
-                data_processor = DataProcessor(text_parser.date_pattern)
-                file_data = data_processor.process_data(sections, file_index)
-                
-                # Combine data from current file
-                for title, periods in file_data.items():
-                    if title not in combined_data:
-                        combined_data[title] = {}
-                    for period, data in periods.items():
-                        if period not in combined_data[title]:
-                            combined_data[title][period] = {"prices": [], "file_averages": {}}
-                        combined_data[title][period]["prices"].extend(data["prices"])
-                        combined_data[title][period]["file_averages"].update(data["file_averages"])
-                
-                print(f"\nProcessed {os.path.basename(pdf_path)}")
+            # Combine records from each file, in selection order
+            for file_index, file_data in _process_files(jobs, file_workers):
+                for column, values in file_data.items():
+                    combined_data[column].extend(values)
+
+                print(f"\nProcessed {file_names[file_index]}")
 
             output_file = os.path.join(get_resource_path("excel-output"), f"Combined_Market_Data_{current_time}.xlsx")
             
@@ -507,4 +683,6 @@ def main():
             sys.exit()
 
 if __name__ == "__main__":
+    # Required for worker processes in the PyInstaller build
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -52,9 +52,6 @@ a = Analysis(
         'pandas',
         'pathlib',
         'pdfminer.six',
-        'pdfplumber',
-        'pdfplumber.utils',
-        'pdfplumber.display',
         'pillow',
         'prov',
         'puremagic',
@@ -83,6 +80,7 @@ a = Analysis(
         'urllib3',
         'uvicorn',
         'wcwidth',
+        'xlsxwriter',
         'xmod'
     ],
     hookspath=['./hooks'],